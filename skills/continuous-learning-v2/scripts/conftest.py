@@ -0,0 +1,9 @@
+"""Shared pytest configuration for the instinct CLI tests."""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "filesystem: test touches the real filesystem; run the pure "
+        "parse tests alone with -m 'not filesystem'",
+    )
@@ -10,11 +10,12 @@ Commands:
 """
 
 import argparse
-import json
+import functools
+import heapq
 import os
 import sys
 import re
-import urllib.request
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
@@ -40,28 +41,50 @@ for d in [PERSONAL_DIR, INHERITED_DIR, EVOLVED_DIR / "skills", EVOLVED_DIR / "co
 # Instinct Parser
 # ─────────────────────────────────────────────
 
+# All 11 possible confidence bars, precomputed so the status loop does a
+# list index instead of two string multiplications per row
+_CONF_BARS = ['█' * n + '░' * (10 - n) for n in range(11)]
+
+_RULE = '=' * 60
+
+# Extracts the first paragraph under an "## Action" heading
+_ACTION_RE = re.compile(r'## Action\s*\n\s*(.+?)(?:\n\n|\n##|$)', re.DOTALL)
+
+# Keywords stripped when normalizing triggers into cluster keys
+_TRIGGER_STRIP = re.compile(r'\b(when|creating|writing|adding|implementing|testing)\b')
+
+# Collapses a lowered trigger into a file-name-safe slug
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Leading filler words dropped when deriving command names from triggers
+_CMD_PREFIX_RE = re.compile(r'^(?:(?:when|implementing)\s+)+')
+
+# Matches the id line inside a frontmatter block
+_ID_RE = re.compile(r'^id\s*:\s*["\']?([^"\'\n]+?)["\']?\s*$', re.MULTILINE)
+
+# Matches one "---\n<frontmatter>\n---\n<body>" document; the body runs
+# until the next document delimiter or end of input. A single C-level
+# regex pass replaces the old per-line state machine.
+_DOC_RE = re.compile(
+    r'^---[ \t]*\n(.*?)^---[ \t]*(?:\n|\Z)(.*?)(?=^---[ \t]*$|\Z)',
+    re.MULTILINE | re.DOTALL,
+)
+
+
 def parse_instinct_file(content: str) -> list[dict]:
     """Parse YAML-like instinct file format."""
     instincts = []
-    current = {}
-    in_frontmatter = False
-    content_lines = []
-
-    for line in content.split('\n'):
-        if line.strip() == '---':
-            if in_frontmatter:
-                # End of frontmatter - content comes next, don't append yet
-                in_frontmatter = False
-            else:
-                # Start of frontmatter
-                in_frontmatter = True
-                if current:
-                    current['content'] = '\n'.join(content_lines).strip()
-                    instincts.append(current)
-                current = {}
-                content_lines = []
-        elif in_frontmatter:
-            # Parse YAML-like frontmatter
+
+    # Normalize line endings so _DOC_RE delimiters match files fetched
+    # from URLs or written on Windows (one C-level pass, usually a no-op)
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    for match in _DOC_RE.finditer(content):
+        frontmatter, body = match.groups()
+        current = {}
+        # Parse YAML-like frontmatter (small block, cheap to walk)
+        for line in frontmatter.splitlines():
             if ':' in line:
                 key, value = line.split(':', 1)
                 key = key.strip()
@@ -70,43 +93,204 @@ def parse_instinct_file(content: str) -> list[dict]:
                     current[key] = float(value)
                 else:
                     current[key] = value
-        else:
-            content_lines.append(line)
-
-    # Don't forget the last instinct
-    if current:
-        current['content'] = '\n'.join(content_lines).strip()
+        current['content'] = body.strip()
         instincts.append(current)
 
     return [i for i in instincts if i.get('id')]
 
 
-def load_all_instincts() -> list[dict]:
-    """Load all instincts from personal and inherited directories."""
+# Instincts are stable for the lifetime of a CLI invocation, so load them
+# once per process instead of re-reading the directories on every call.
+_INSTINCTS_CACHE: Optional[list[dict]] = None
+
+# Per-file parse cache keyed by path, storing (st_mtime_ns, parsed).
+# Unchanged files cost a single stat instead of a read + parse, and the
+# pristine parse can serve multiple call sites (source decoration happens
+# on copies, outside the cache).
+_PARSE_CACHE: dict[str, tuple[int, list[dict]]] = {}
+
+# Per-file id sets for the ids-only fast path, keyed the same way
+_ID_CACHE: dict[str, tuple[int, frozenset[str]]] = {}
+
+
+def clear_instinct_cache():
+    """Reset the process-level instinct caches (used by tests)."""
+    global _INSTINCTS_CACHE
+    _INSTINCTS_CACHE = None
+    _PARSE_CACHE.clear()
+    _ID_CACHE.clear()
+    _list_instinct_files.cache_clear()
+
+
+_INSTINCT_SUFFIXES = ('.yaml', '.yml', '.md')
+
+
+@functools.lru_cache(maxsize=512)
+def _list_instinct_files(dir_str: str, mtime_ns: int) -> tuple[str, ...]:
+    """Sorted instinct file names in a directory.
+
+    Keyed on the directory mtime, so repeat listings within a process
+    cost one os.stat instead of a full readdir; adding or removing a
+    file bumps the mtime and invalidates the entry. Content changes are
+    caught downstream by the per-file parse cache.
+    """
+    with os.scandir(dir_str) as entries:
+        return tuple(sorted(
+            e.name for e in entries
+            if e.name.endswith(_INSTINCT_SUFFIXES) and e.is_file()
+        ))
+
+
+def _read_text(path: str) -> str:
+    """Read a whole file as UTF-8, skipping TextIOWrapper setup.
+
+    Newline translation is not needed here: parse_instinct_file
+    normalizes CRLF itself.
+    """
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def _load_instincts_from_dir(directory: Path) -> list[dict]:
+    """Load and decorate all instinct files in a single directory."""
     instincts = []
+    source_type = directory.name
+
+    dir_str = str(directory)
+    try:
+        names = _list_instinct_files(dir_str, os.stat(dir_str).st_mtime_ns)
+    except OSError as e:
+        print(f"Warning: Failed to list {directory}: {e}", file=sys.stderr)
+        return instincts
+
+    def _load_one(name: str) -> tuple[str, list[dict]]:
+        key = os.path.join(dir_str, name)
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                parsed = cached[1]
+            else:
+                parsed = parse_instinct_file(_read_text(key))
+                _PARSE_CACHE[key] = (mtime_ns, parsed)
+            return key, parsed
+        except Exception as e:
+            print(f"Warning: Failed to parse {key}: {e}", file=sys.stderr)
+            return key, []
+
+    # Fan out stat/read syscalls (which release the GIL) for larger
+    # directories; executor.map preserves file order. Below 8 files the
+    # pool setup costs more than it saves.
+    if len(names) >= 8:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(_load_one, names))
+    else:
+        results = [_load_one(name) for name in names]
+
+    for key, parsed in results:
+        for inst in parsed:
+            instincts.append({
+                **inst,
+                '_source_file': key,
+                '_source_type': source_type,
+            })
+
+    return instincts
+
+
+def load_all_instinct_ids() -> set[str]:
+    """Collect instinct ids without building full instinct dicts.
+
+    Dedup checks only need the id set, so this scans frontmatter id
+    lines and never materializes content bodies.
+    """
+    ids: set[str] = set()
 
     for directory in [PERSONAL_DIR, INHERITED_DIR]:
-        if not directory.exists():
+        dir_str = str(directory)
+        try:
+            names = _list_instinct_files(dir_str, os.stat(dir_str).st_mtime_ns)
+        except OSError:
             continue
-        yaml_files = sorted(
-            set(directory.glob("*.yaml"))
-            | set(directory.glob("*.yml"))
-            | set(directory.glob("*.md"))
-        )
-        for file in yaml_files:
+        for name in names:
+            path = os.path.join(dir_str, name)
             try:
-                content = file.read_text()
-                parsed = parse_instinct_file(content)
-                for inst in parsed:
-                    inst['_source_file'] = str(file)
-                    inst['_source_type'] = directory.name
-                instincts.extend(parsed)
+                mtime_ns = os.stat(path).st_mtime_ns
+                cached = _ID_CACHE.get(path)
+                if cached is not None and cached[0] == mtime_ns:
+                    ids.update(cached[1])
+                    continue
+                content = _read_text(path)
             except Exception as e:
-                print(f"Warning: Failed to parse {file}: {e}", file=sys.stderr)
+                # Same warn-and-skip as _load_one: a stat failure or a
+                # non-UTF-8 file must not abort the whole id scan
+                print(f"Warning: Failed to parse {path}: {e}", file=sys.stderr)
+                continue
+            # Same normalization as parse_instinct_file: _DOC_RE anchors
+            # on bare \n delimiters, so CRLF files would yield no ids
+            if '\r' in content:
+                content = content.replace('\r\n', '\n')
+            file_ids = frozenset(
+                id_match.group(1)
+                for match in _DOC_RE.finditer(content)
+                if (id_match := _ID_RE.search(match.group(1)))
+            )
+            _ID_CACHE[path] = (mtime_ns, file_ids)
+            ids.update(file_ids)
+
+    return ids
+
+
+def load_all_instincts() -> list[dict]:
+    """Load all instincts from personal and inherited directories."""
+    global _INSTINCTS_CACHE
+    if _INSTINCTS_CACHE is not None:
+        return _INSTINCTS_CACHE
 
+    instincts = []
+    for directory in [PERSONAL_DIR, INHERITED_DIR]:
+        if directory.exists():
+            instincts.extend(_load_instincts_from_dir(directory))
+
+    _INSTINCTS_CACHE = instincts
     return instincts
 
 
+def _count_lines(path: Path) -> int:
+    """Count lines in a file via chunked byte scans.
+
+    bytes.count runs in C (memchr), an order of magnitude faster than
+    iterating lines in Python. Empty files short-circuit on the stat.
+    """
+    if os.stat(path).st_size == 0:
+        return 0
+
+    count = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        for buf in iter(lambda: f.read(1 << 20), b''):
+            count += buf.count(b'\n')
+            last = buf[-1:]
+    if last != b'\n':
+        count += 1  # final line lacks a trailing newline
+    return count
+
+
+def _atomic_write_text(path: Path, text: str):
+    """Write text to path atomically (tmp file + rename).
+
+    An interrupt mid-write can no longer leave a truncated instinct
+    file behind.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    # Pre-encode and write bytes: skips TextIOWrapper setup and locale
+    # encoding detection on every write
+    tmp.write_bytes(text.encode('utf-8'))
+    os.replace(tmp, path)
+
+
 # ─────────────────────────────────────────────
 # Status Command
 # ─────────────────────────────────────────────
@@ -122,56 +306,68 @@ def cmd_status(args):
         print(f"  Inherited: {INHERITED_DIR}")
         return
 
-    # Group by domain
+    # Single pass: group by domain and tally sources together instead of
+    # walking the full list three times
     by_domain = defaultdict(list)
+    source_counts = {'personal': 0, 'inherited': 0}
     for inst in instincts:
-        domain = inst.get('domain', 'general')
-        by_domain[domain].append(inst)
+        by_domain[inst.get('domain', 'general')].append(inst)
+        source = inst.get('_source_type')
+        if source in source_counts:
+            source_counts[source] += 1
 
-    # Print header
-    print(f"\n{'='*60}")
-    print(f"  INSTINCT STATUS - {len(instincts)} total")
-    print(f"{'='*60}\n")
+    # Buffer the report and write it once — per-line print() acquires
+    # the stdout lock and flushes for every row of every instinct
+    out = []
+
+    # Header
+    out.append(f"\n{_RULE}")
+    out.append(f"  INSTINCT STATUS - {len(instincts)} total")
+    out.append(f"{_RULE}\n")
 
     # Summary by source
-    personal = [i for i in instincts if i.get('_source_type') == 'personal']
-    inherited = [i for i in instincts if i.get('_source_type') == 'inherited']
-    print(f"  Personal:  {len(personal)}")
-    print(f"  Inherited: {len(inherited)}")
-    print()
+    out.append(f"  Personal:  {source_counts['personal']}")
+    out.append(f"  Inherited: {source_counts['inherited']}")
+    out.append('')
 
-    # Print by domain
+    # Report by domain
     for domain in sorted(by_domain.keys()):
         domain_instincts = by_domain[domain]
-        print(f"## {domain.upper()} ({len(domain_instincts)})")
-        print()
+        out.append(f"## {domain.upper()} ({len(domain_instincts)})")
+        out.append('')
+
+        # Decorate-sort with itemgetter: comparisons run in C instead of
+        # calling a lambda (and .get) per compare; stability keeps the
+        # original order for equal confidences
+        decorated = [(inst.get('confidence', 0.5), inst) for inst in domain_instincts]
+        decorated.sort(key=itemgetter(0), reverse=True)
 
-        for inst in sorted(domain_instincts, key=lambda x: -x.get('confidence', 0.5)):
-            conf = inst.get('confidence', 0.5)
-            conf_bar = '█' * int(conf * 10) + '░' * (10 - int(conf * 10))
+        for conf, inst in decorated:
+            conf_bar = _CONF_BARS[max(0, min(int(conf * 10), 10))]
             trigger = inst.get('trigger', 'unknown trigger')
             source = inst.get('source', 'unknown')
 
-            print(f"  {conf_bar} {int(conf*100):3d}%  {inst.get('id', 'unnamed')}")
-            print(f"            trigger: {trigger}")
+            out.append(f"  {conf_bar} {int(conf*100):3d}%  {inst.get('id', 'unnamed')}")
+            out.append(f"            trigger: {trigger}")
 
             # Extract action from content
             content = inst.get('content', '')
-            action_match = re.search(r'## Action\s*\n\s*(.+?)(?:\n\n|\n##|$)', content, re.DOTALL)
+            action_match = _ACTION_RE.search(content)
             if action_match:
-                action = action_match.group(1).strip().split('\n')[0]
-                print(f"            action: {action[:60]}{'...' if len(action) > 60 else ''}")
+                action = action_match.group(1).strip().partition('\n')[0]
+                out.append(f"            action: {action[:60]}{'...' if len(action) > 60 else ''}")
 
-            print()
+            out.append('')
 
     # Observations stats
     if OBSERVATIONS_FILE.exists():
-        obs_count = sum(1 for _ in open(OBSERVATIONS_FILE))
-        print(f"─────────────────────────────────────────────────────────")
-        print(f"  Observations: {obs_count} events logged")
-        print(f"  File: {OBSERVATIONS_FILE}")
+        obs_count = _count_lines(OBSERVATIONS_FILE)
+        out.append("─────────────────────────────────────────────────────────")
+        out.append(f"  Observations: {obs_count} events logged")
+        out.append(f"  File: {OBSERVATIONS_FILE}")
 
-    print(f"\n{'='*60}\n")
+    out.append(f"\n{_RULE}\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ─────────────────────────────────────────────
@@ -184,6 +380,10 @@ def cmd_import(args):
 
     # Fetch content
     if source.startswith('http://') or source.startswith('https://'):
+        # Deferred: urllib.request drags in http/email/ssl, which the
+        # other commands (and file imports) never need
+        import urllib.request
+
         print(f"Fetching from URL: {source}")
         try:
             with urllib.request.urlopen(source) as response:
@@ -196,7 +396,7 @@ def cmd_import(args):
         if not path.exists():
             print(f"File not found: {path}", file=sys.stderr)
             return 1
-        content = path.read_text()
+        content = _read_text(str(path))
 
     # Parse instincts
     new_instincts = parse_instinct_file(content)
@@ -206,9 +406,10 @@ def cmd_import(args):
 
     print(f"\nFound {len(new_instincts)} instincts to import.\n")
 
-    # Load existing
-    existing = load_all_instincts()
-    existing_ids = {i.get('id') for i in existing}
+    # Dedup only needs the id set; full instincts are loaded lazily and
+    # only when an id collision requires a confidence comparison
+    existing_ids = load_all_instinct_ids()
+    existing_by_id: Optional[dict] = None
 
     # Categorize
     to_add = []
@@ -218,9 +419,11 @@ def cmd_import(args):
     for inst in new_instincts:
         inst_id = inst.get('id')
         if inst_id in existing_ids:
-            # Check if we should update
-            existing_inst = next((e for e in existing if e.get('id') == inst_id), None)
-            if existing_inst:
+            if existing_by_id is None:
+                existing_by_id = {e['id']: e for e in load_all_instincts() if e.get('id')}
+            existing_inst = existing_by_id.get(inst_id)
+            if existing_inst is not None:
+                # Check if we should update
                 if inst.get('confidence', 0) > existing_inst.get('confidence', 0):
                     to_update.append(inst)
                 else:
@@ -266,28 +469,35 @@ def cmd_import(args):
             print("Cancelled.")
             return 0
 
-    # Write to inherited directory
-    timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    # Write to inherited directory — one batch timestamp for both the
+    # filename and the header
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d-%H%M%S')
     source_name = Path(source).stem if not source.startswith('http') else 'web-import'
     output_file = INHERITED_DIR / f"{source_name}-{timestamp}.yaml"
 
     all_to_write = to_add + to_update
-    output_content = f"# Imported from {source}\n# Date: {datetime.now().isoformat()}\n\n"
+    # Append to a list and join once — repeated += on a str copies all
+    # prior bytes on every statement.
+    parts = [f"# Imported from {source}\n# Date: {now.isoformat()}\n\n"]
 
     for inst in all_to_write:
-        output_content += "---\n"
-        output_content += f"id: {inst.get('id')}\n"
-        output_content += f"trigger: \"{inst.get('trigger', 'unknown')}\"\n"
-        output_content += f"confidence: {inst.get('confidence', 0.5)}\n"
-        output_content += f"domain: {inst.get('domain', 'general')}\n"
-        output_content += f"source: inherited\n"
-        output_content += f"imported_from: \"{source}\"\n"
+        # One template per instinct: a single allocation instead of ten
+        # small appends
+        header = (
+            f"---\n"
+            f"id: {inst.get('id')}\n"
+            f"trigger: \"{inst.get('trigger', 'unknown')}\"\n"
+            f"confidence: {inst.get('confidence', 0.5)}\n"
+            f"domain: {inst.get('domain', 'general')}\n"
+            f"source: inherited\n"
+            f"imported_from: \"{source}\"\n"
+        )
         if inst.get('source_repo'):
-            output_content += f"source_repo: {inst.get('source_repo')}\n"
-        output_content += "---\n\n"
-        output_content += inst.get('content', '') + "\n\n"
+            header += f"source_repo: {inst.get('source_repo')}\n"
+        parts.append(f"{header}---\n\n{inst.get('content', '')}\n\n")
 
-    output_file.write_text(output_content)
+    _atomic_write_text(output_file, "".join(parts))
 
     print(f"\n✅ Import complete!")
     print(f"   Added: {len(to_add)}")
@@ -321,24 +531,26 @@ def cmd_export(args):
         print("No instincts match the criteria.")
         return 1
 
-    # Generate output
-    output = f"# Instincts export\n# Date: {datetime.now().isoformat()}\n# Total: {len(instincts)}\n\n"
+    # Generate output via list-join (repeated str += is quadratic)
+    parts = [f"# Instincts export\n# Date: {datetime.now().isoformat()}\n# Total: {len(instincts)}\n\n"]
 
     for inst in instincts:
-        output += "---\n"
+        parts.append("---\n")
         for key in ['id', 'trigger', 'confidence', 'domain', 'source', 'source_repo']:
             if inst.get(key):
                 value = inst[key]
                 if key == 'trigger':
-                    output += f'{key}: "{value}"\n'
+                    parts.append(f'{key}: "{value}"\n')
                 else:
-                    output += f"{key}: {value}\n"
-        output += "---\n\n"
-        output += inst.get('content', '') + "\n\n"
+                    parts.append(f"{key}: {value}\n")
+        parts.append("---\n\n")
+        parts.append(inst.get('content', '') + "\n\n")
+
+    output = "".join(parts)
 
     # Write to file or stdout
     if args.output:
-        Path(args.output).write_text(output)
+        _atomic_write_text(Path(args.output), output)
         print(f"Exported {len(instincts)} instincts to {args.output}")
     else:
         print(output)
@@ -359,94 +571,102 @@ def cmd_evolve(args):
         print(f"Currently have: {len(instincts)}")
         return 1
 
-    print(f"\n{'='*60}")
-    print(f"  EVOLVE ANALYSIS - {len(instincts)} instincts")
-    print(f"{'='*60}\n")
-
-    # Group by domain
-    by_domain = defaultdict(list)
-    for inst in instincts:
-        domain = inst.get('domain', 'general')
-        by_domain[domain].append(inst)
-
-    # High-confidence instincts by domain (candidates for skills)
-    high_conf = [i for i in instincts if i.get('confidence', 0) >= 0.8]
-    print(f"High confidence instincts (>=80%): {len(high_conf)}")
-
-    # Find clusters (instincts with similar triggers)
-    trigger_clusters = defaultdict(list)
+    # Buffer the analysis and write it once (see cmd_status)
+    out = []
+    out.append(f"\n{_RULE}")
+    out.append(f"  EVOLVE ANALYSIS - {len(instincts)} instincts")
+    out.append(f"{_RULE}\n")
+
+    # Single pass: count high-confidence instincts and keep running
+    # confidence sums and domain sets per cluster, so candidate
+    # construction below never re-walks cluster members
+    high_conf_count = 0
+    trigger_clusters = {}
     for inst in instincts:
-        trigger = inst.get('trigger', '')
-        # Normalize trigger
-        trigger_key = trigger.lower()
-        for keyword in ['when', 'creating', 'writing', 'adding', 'implementing', 'testing']:
-            trigger_key = trigger_key.replace(keyword, '').strip()
-        trigger_clusters[trigger_key].append(inst)
-
-    # Find clusters with 3+ instincts (good skill candidates)
+        if inst.get('confidence', 0) >= 0.8:
+            high_conf_count += 1
+        trigger_key = _TRIGGER_STRIP.sub('', inst.get('trigger', '').lower()).strip()
+        cluster = trigger_clusters.get(trigger_key)
+        if cluster is None:
+            cluster = trigger_clusters[trigger_key] = {
+                'instincts': [], 'sum_conf': 0.0, 'domains': set()
+            }
+        cluster['instincts'].append(inst)
+        cluster['sum_conf'] += inst.get('confidence', 0.5)
+        cluster['domains'].add(inst.get('domain', 'general'))
+
+    out.append(f"High confidence instincts (>=80%): {high_conf_count}")
+
+    # Find clusters with 2+ instincts (good skill candidates)
     skill_candidates = []
     for trigger, cluster in trigger_clusters.items():
-        if len(cluster) >= 2:
-            avg_conf = sum(i.get('confidence', 0.5) for i in cluster) / len(cluster)
+        count = len(cluster['instincts'])
+        if count >= 2:
             skill_candidates.append({
                 'trigger': trigger,
-                'instincts': cluster,
-                'avg_confidence': avg_conf,
-                'domains': list(set(i.get('domain', 'general') for i in cluster))
+                'instincts': cluster['instincts'],
+                'avg_confidence': cluster['sum_conf'] / count,
+                'domains': cluster['domains']
             })
 
-    # Sort by cluster size and confidence
-    skill_candidates.sort(key=lambda x: (-len(x['instincts']), -x['avg_confidence']))
+    # Pick the top clusters by size and confidence — nlargest is
+    # O(N log 5) versus a full sort and skips the sorted copy
+    def cluster_rank(cand):
+        return (len(cand['instincts']), cand['avg_confidence'])
+
+    top_skills = heapq.nlargest(5, skill_candidates, key=cluster_rank)
 
-    print(f"\nPotential skill clusters found: {len(skill_candidates)}")
+    out.append(f"\nPotential skill clusters found: {len(skill_candidates)}")
 
-    if skill_candidates:
-        print(f"\n## SKILL CANDIDATES\n")
-        for i, cand in enumerate(skill_candidates[:5], 1):
-            print(f"{i}. Cluster: \"{cand['trigger']}\"")
-            print(f"   Instincts: {len(cand['instincts'])}")
-            print(f"   Avg confidence: {cand['avg_confidence']:.0%}")
-            print(f"   Domains: {', '.join(cand['domains'])}")
-            print(f"   Instincts:")
+    if top_skills:
+        out.append(f"\n## SKILL CANDIDATES\n")
+        for i, cand in enumerate(top_skills, 1):
+            out.append(f"{i}. Cluster: \"{cand['trigger']}\"")
+            out.append(f"   Instincts: {len(cand['instincts'])}")
+            out.append(f"   Avg confidence: {cand['avg_confidence']:.0%}")
+            out.append(f"   Domains: {', '.join(sorted(cand['domains']))}")
+            out.append(f"   Instincts:")
             for inst in cand['instincts'][:3]:
-                print(f"     - {inst.get('id')}")
-            print()
+                out.append(f"     - {inst.get('id')}")
+            out.append('')
 
     # Command candidates (workflow instincts with high confidence)
     workflow_instincts = [i for i in instincts if i.get('domain') == 'workflow' and i.get('confidence', 0) >= 0.7]
     if workflow_instincts:
-        print(f"\n## COMMAND CANDIDATES ({len(workflow_instincts)})\n")
+        out.append(f"\n## COMMAND CANDIDATES ({len(workflow_instincts)})\n")
         for inst in workflow_instincts[:5]:
             trigger = inst.get('trigger', 'unknown')
             # Suggest command name
             cmd_name = trigger.replace('when ', '').replace('implementing ', '').replace('a ', '')
             cmd_name = cmd_name.replace(' ', '-')[:20]
-            print(f"  /{cmd_name}")
-            print(f"    From: {inst.get('id')}")
-            print(f"    Confidence: {inst.get('confidence', 0.5):.0%}")
-            print()
+            out.append(f"  /{cmd_name}")
+            out.append(f"    From: {inst.get('id')}")
+            out.append(f"    Confidence: {inst.get('confidence', 0.5):.0%}")
+            out.append('')
 
     # Agent candidates (complex multi-step patterns)
     agent_candidates = [c for c in skill_candidates if len(c['instincts']) >= 3 and c['avg_confidence'] >= 0.75]
+    top_agents = heapq.nlargest(3, agent_candidates, key=cluster_rank)
     if agent_candidates:
-        print(f"\n## AGENT CANDIDATES ({len(agent_candidates)})\n")
-        for cand in agent_candidates[:3]:
+        out.append(f"\n## AGENT CANDIDATES ({len(agent_candidates)})\n")
+        for cand in top_agents:
             agent_name = cand['trigger'].replace(' ', '-')[:20] + '-agent'
-            print(f"  {agent_name}")
-            print(f"    Covers {len(cand['instincts'])} instincts")
-            print(f"    Avg confidence: {cand['avg_confidence']:.0%}")
-            print()
+            out.append(f"  {agent_name}")
+            out.append(f"    Covers {len(cand['instincts'])} instincts")
+            out.append(f"    Avg confidence: {cand['avg_confidence']:.0%}")
+            out.append('')
 
     if args.generate:
-        generated = _generate_evolved(skill_candidates, workflow_instincts, agent_candidates)
+        generated = _generate_evolved(top_skills, workflow_instincts, top_agents)
         if generated:
-            print(f"\n✅ Generated {len(generated)} evolved structures:")
+            out.append(f"\n✅ Generated {len(generated)} evolved structures:")
             for path in generated:
-                print(f"   {path}")
+                out.append(f"   {path}")
         else:
-            print("\nNo structures generated (need higher-confidence clusters).")
+            out.append("\nNo structures generated (need higher-confidence clusters).")
 
-    print(f"\n{'='*60}\n")
+    out.append(f"\n{_RULE}\n")
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
@@ -463,66 +683,73 @@ def _generate_evolved(skill_candidates: list, workflow_instincts: list, agent_ca
         trigger = cand['trigger'].strip()
         if not trigger:
             continue
-        name = re.sub(r'[^a-z0-9]+', '-', trigger.lower()).strip('-')[:30]
+        name = _SLUG_RE.sub('-', trigger.lower()).strip('-')[:30]
         if not name:
             continue
 
         skill_dir = EVOLVED_DIR / "skills" / name
         skill_dir.mkdir(parents=True, exist_ok=True)
 
-        content = f"# {name}\n\n"
-        content += f"Evolved from {len(cand['instincts'])} instincts "
-        content += f"(avg confidence: {cand['avg_confidence']:.0%})\n\n"
-        content += f"## When to Apply\n\n"
-        content += f"Trigger: {trigger}\n\n"
-        content += f"## Actions\n\n"
+        # Build via list + join; += in the actions loop copies the whole
+        # string once per instinct
+        parts = [
+            f"# {name}\n\n"
+            f"Evolved from {len(cand['instincts'])} instincts "
+            f"(avg confidence: {cand['avg_confidence']:.0%})\n\n"
+            f"## When to Apply\n\n"
+            f"Trigger: {trigger}\n\n"
+            f"## Actions\n\n"
+        ]
         for inst in cand['instincts']:
             inst_content = inst.get('content', '')
-            action_match = re.search(r'## Action\s*\n\s*(.+?)(?:\n\n|\n##|$)', inst_content, re.DOTALL)
+            action_match = _ACTION_RE.search(inst_content)
             action = action_match.group(1).strip() if action_match else inst.get('id', 'unnamed')
-            content += f"- {action}\n"
+            parts.append(f"- {action}\n")
 
-        (skill_dir / "SKILL.md").write_text(content)
+        (skill_dir / "SKILL.md").write_bytes("".join(parts).encode('utf-8'))
         generated.append(str(skill_dir / "SKILL.md"))
 
     # Generate commands from workflow instincts
     for inst in workflow_instincts[:5]:
         trigger = inst.get('trigger', 'unknown')
-        cmd_name = re.sub(r'[^a-z0-9]+', '-', trigger.lower().replace('when ', '').replace('implementing ', ''))
+        cmd_name = _SLUG_RE.sub('-', _CMD_PREFIX_RE.sub('', trigger.lower()))
         cmd_name = cmd_name.strip('-')[:20]
         if not cmd_name:
             continue
 
         cmd_file = EVOLVED_DIR / "commands" / f"{cmd_name}.md"
-        content = f"# {cmd_name}\n\n"
-        content += f"Evolved from instinct: {inst.get('id', 'unnamed')}\n"
-        content += f"Confidence: {inst.get('confidence', 0.5):.0%}\n\n"
-        content += inst.get('content', '')
+        content = (
+            f"# {cmd_name}\n\n"
+            f"Evolved from instinct: {inst.get('id', 'unnamed')}\n"
+            f"Confidence: {inst.get('confidence', 0.5):.0%}\n\n"
+            f"{inst.get('content', '')}"
+        )
 
-        cmd_file.write_text(content)
+        cmd_file.write_bytes(content.encode('utf-8'))
         generated.append(str(cmd_file))
 
     # Generate agents from complex clusters
     for cand in agent_candidates[:3]:
         trigger = cand['trigger'].strip()
-        agent_name = re.sub(r'[^a-z0-9]+', '-', trigger.lower()).strip('-')[:20]
+        agent_name = _SLUG_RE.sub('-', trigger.lower()).strip('-')[:20]
         if not agent_name:
             continue
 
         agent_file = EVOLVED_DIR / "agents" / f"{agent_name}.md"
-        domains = ', '.join(cand['domains'])
+        domains = ', '.join(sorted(cand['domains']))
         instinct_ids = [i.get('id', 'unnamed') for i in cand['instincts']]
 
-        content = f"---\nmodel: sonnet\ntools: Read, Grep, Glob\n---\n"
-        content += f"# {agent_name}\n\n"
-        content += f"Evolved from {len(cand['instincts'])} instincts "
-        content += f"(avg confidence: {cand['avg_confidence']:.0%})\n"
-        content += f"Domains: {domains}\n\n"
-        content += f"## Source Instincts\n\n"
-        for iid in instinct_ids:
-            content += f"- {iid}\n"
-
-        agent_file.write_text(content)
+        parts = [
+            f"---\nmodel: sonnet\ntools: Read, Grep, Glob\n---\n"
+            f"# {agent_name}\n\n"
+            f"Evolved from {len(cand['instincts'])} instincts "
+            f"(avg confidence: {cand['avg_confidence']:.0%})\n"
+            f"Domains: {domains}\n\n"
+            f"## Source Instincts\n\n"
+        ]
+        parts.extend(f"- {iid}\n" for iid in instinct_ids)
+
+        agent_file.write_bytes("".join(parts).encode('utf-8'))
         generated.append(str(agent_file))
 
     return generated
@@ -532,43 +759,68 @@ def _generate_evolved(skill_candidates: list, workflow_instincts: list, agent_ca
 # Main
 # ─────────────────────────────────────────────
 
-def main():
-    parser = argparse.ArgumentParser(description='Instinct CLI for Continuous Learning v2')
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # Status
+def _add_status_parser(subparsers):
     status_parser = subparsers.add_parser('status', help='Show instinct status')
+    status_parser.set_defaults(func=cmd_status)
 
-    # Import
+
+def _add_import_parser(subparsers):
     import_parser = subparsers.add_parser('import', help='Import instincts')
     import_parser.add_argument('source', help='File path or URL')
     import_parser.add_argument('--dry-run', action='store_true', help='Preview without importing')
     import_parser.add_argument('--force', action='store_true', help='Skip confirmation')
     import_parser.add_argument('--min-confidence', type=float, help='Minimum confidence threshold')
+    import_parser.set_defaults(func=cmd_import)
+
 
-    # Export
+def _add_export_parser(subparsers):
     export_parser = subparsers.add_parser('export', help='Export instincts')
     export_parser.add_argument('--output', '-o', help='Output file')
     export_parser.add_argument('--domain', help='Filter by domain')
     export_parser.add_argument('--min-confidence', type=float, help='Minimum confidence')
+    export_parser.set_defaults(func=cmd_export)
+
 
-    # Evolve
+def _add_evolve_parser(subparsers):
     evolve_parser = subparsers.add_parser('evolve', help='Analyze and evolve instincts')
     evolve_parser.add_argument('--generate', action='store_true', help='Generate evolved structures')
+    evolve_parser.set_defaults(func=cmd_evolve)
+
+
+_SUBPARSER_BUILDERS = {
+    'status': _add_status_parser,
+    'import': _add_import_parser,
+    'export': _add_export_parser,
+    'evolve': _add_evolve_parser,
+}
+
 
-    args = parser.parse_args()
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
 
-    if args.command == 'status':
-        return cmd_status(args)
-    elif args.command == 'import':
-        return cmd_import(args)
-    elif args.command == 'export':
-        return cmd_export(args)
-    elif args.command == 'evolve':
-        return cmd_evolve(args)
+    parser = argparse.ArgumentParser(description='Instinct CLI for Continuous Learning v2')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    # Subparser construction is a measurable slice of cold start, so
+    # build only the one that will run; help and unknown commands fall
+    # back to the full build so argparse output stays complete
+    first = argv[0] if argv else None
+    if first in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[first](subparsers)
     else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+
+    args = parser.parse_args(argv)
+
+    # Dispatch directly through the handler argparse attached — no
+    # per-command string comparisons
+    func = getattr(args, 'func', None)
+    if func is None:
         parser.print_help()
         return 1
+    return func(args)
 
 
 if __name__ == '__main__':
@@ -1,16 +1,31 @@
 """Tests for parse_instinct_file() — verifies content after frontmatter is preserved."""
 
+import contextlib
 import importlib.util
+import io
 import os
+import sys
+from types import SimpleNamespace
 
-# Load instinct-cli.py (hyphenated filename requires importlib)
-_spec = importlib.util.spec_from_file_location(
-    "instinct_cli",
-    os.path.join(os.path.dirname(__file__), "instinct-cli.py"),
-)
-_mod = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_mod)
+import pytest
+
+# Load instinct-cli.py (hyphenated filename requires importlib); cache in
+# sys.modules so repeated collection (xdist, --looponfail) doesn't
+# re-execute the module top level
+if "instinct_cli" in sys.modules:
+    _mod = sys.modules["instinct_cli"]
+else:
+    _spec = importlib.util.spec_from_file_location(
+        "instinct_cli",
+        os.path.join(os.path.dirname(__file__), "instinct-cli.py"),
+    )
+    _mod = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_mod)
+    sys.modules["instinct_cli"] = _mod
 parse_instinct_file = _mod.parse_instinct_file
+load_all_instincts = _mod.load_all_instincts
+clear_instinct_cache = _mod.clear_instinct_cache
+_load_instincts_from_dir = _mod._load_instincts_from_dir
 
 
 MULTI_SECTION = """\
@@ -38,9 +53,78 @@ domain: testing
 Do thing B.
 """
 
+# Parsed once at module load; read-only tests assert against this instead
+# of re-running the parser per test
+_MULTI_PARSED = parse_instinct_file(MULTI_SECTION)
+
+# Shared arg object for cmd_* calls; none of them mutate their args
+_EVOLVE_ARGS = SimpleNamespace(generate=False)
+
+# Variants built once instead of per-test .replace chains
+_MULTI_CRLF = MULTI_SECTION.replace("\n", "\r\n")
+_MULTI_IDS_C = MULTI_SECTION.replace("instinct-a", "instinct-c")
+_MULTI_IDS_Z = MULTI_SECTION.replace("instinct-a", "instinct-z")
+
+_DIR_KEYS = ("PERSONAL_DIR", "INHERITED_DIR")
+
+
+def _run_capture(fn, *args, **kwargs):
+    """Run fn with stdout redirected to a StringIO; return (rc, output).
+
+    Bypasses pytest's capsys shim (per-test CaptureIO setup/teardown)
+    for command tests that only need the printed text.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        rc = fn(*args, **kwargs)
+    return rc, buf.getvalue()
+
+
+def _seed(files):
+    """Write test fixture files from a {path: content} dict.
+
+    Uses raw os.open/os.write instead of Path.write_text to skip the
+    TextIOWrapper and context-manager overhead per file.
+    """
+    for p, data in files.items():
+        fd = os.open(str(p), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture
+def instinct_dirs(tmp_path, request):
+    """Point the CLI at fresh personal/inherited dirs under tmp_path.
+
+    Snapshots and restores the module globals in one pass instead of a
+    per-attribute monkeypatch chain, and clears the instinct caches on
+    both sides.
+    """
+    saved = {k: getattr(_mod, k) for k in _DIR_KEYS}
+    dirs = {}
+    for key in _DIR_KEYS:
+        name = key.split("_")[0].lower()
+        d = tmp_path / name
+        # os.makedirs directly: skips Path.mkdir's wrapper and parent
+        # probing; tmp_path itself already exists
+        os.makedirs(d, exist_ok=True)
+        setattr(_mod, key, d)
+        dirs[name] = d
+    clear_instinct_cache()
+
+    def _restore():
+        for k, v in saved.items():
+            setattr(_mod, k, v)
+        clear_instinct_cache()
+
+    request.addfinalizer(_restore)
+    return SimpleNamespace(**dirs)
+
 
 def test_multiple_instincts_preserve_content():
-    result = parse_instinct_file(MULTI_SECTION)
+    result = _MULTI_PARSED
     assert len(result) == 2
     assert "Do thing A." in result[0]["content"]
     assert "Example A1" in result[0]["content"]
@@ -80,3 +164,155 @@ domain: general
     result = parse_instinct_file(content)
     assert len(result) == 1
     assert result[0]["content"] == ""
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        pytest.param("", id="empty-string"),
+        pytest.param("no delimiters\njust text\n", id="garbage"),
+        pytest.param(
+            '---\ntrigger: "when anything"\nconfidence: 0.5\n---\n'
+            "\n## Action\nAnonymous instinct.\n",
+            id="missing-id",
+        ),
+    ],
+)
+def test_parse_yields_nothing(src):
+    assert parse_instinct_file(src) == []
+
+
+def test_parse_confidence_is_float():
+    content = """\
+---
+id: floaty
+confidence: 0.42
+---
+"""
+    result = parse_instinct_file(content)
+    # float("0.42") is deterministic, so exact comparison is correct and
+    # skips the ApproxScalar tolerance machinery
+    assert result[0]["confidence"] == 0.42
+
+
+def test_parse_crlf_line_endings():
+    result = parse_instinct_file(_MULTI_CRLF)
+    assert len(result) == 2
+    assert "Do thing A." in result[0]["content"]
+
+
+def test_parse_trigger_strips_quotes():
+    assert _MULTI_PARSED[0]["trigger"] == "when coding"
+    assert _MULTI_PARSED[1]["trigger"] == "when testing"
+
+
+@pytest.mark.filesystem
+def test_load_all_instincts_is_cached(instinct_dirs):
+    _seed({instinct_dirs.personal / "a.yaml": MULTI_SECTION})
+
+    first = load_all_instincts()
+    assert len(first) == 2
+
+    # A new file does not show up until the cache is cleared
+    _seed({instinct_dirs.personal / "b.yaml": _MULTI_IDS_C})
+    assert load_all_instincts() is first
+
+    clear_instinct_cache()
+    assert len(load_all_instincts()) == 4
+
+
+@pytest.fixture(scope="session")
+def many_instincts_dir(tmp_path_factory):
+    """A directory of 10 instinct files, built once for the session.
+
+    Tests that only read from it share the same tree instead of
+    re-creating 10 files each.
+    """
+    d = tmp_path_factory.mktemp("many_instincts")
+    _seed({
+        d / f"i{n:02d}.yaml":
+            f"---\nid: inst-{n:02d}\nconfidence: 0.5\n---\n\n## Action\nDo {n}.\n"
+        for n in range(10)
+    })
+    return d
+
+
+@pytest.fixture(scope="session")
+def many_instincts_loaded(many_instincts_dir):
+    """The many-files tree loaded once; read-only tests share the result."""
+    clear_instinct_cache()
+    result = _load_instincts_from_dir(many_instincts_dir)
+    clear_instinct_cache()
+    return result
+
+
+@pytest.mark.filesystem
+def test_load_from_dir_many_files_keeps_order(many_instincts_loaded):
+    # 10 files crosses the threaded fan-out threshold in
+    # _load_instincts_from_dir; order must stay sorted by file name
+    result = many_instincts_loaded
+    assert [i["id"] for i in result] == [f"inst-{n:02d}" for n in range(10)]
+
+
+@pytest.mark.filesystem
+def test_count_lines(tmp_path):
+    f = tmp_path / "obs.jsonl"
+    f.write_text("")
+    assert _mod._count_lines(f) == 0
+    f.write_text('{"a":1}\n{"b":2}\n')
+    assert _mod._count_lines(f) == 2
+    f.write_text('{"a":1}\n{"b":2}')  # no trailing newline
+    assert _mod._count_lines(f) == 2
+
+
+@pytest.mark.filesystem
+def test_load_all_instinct_ids(instinct_dirs):
+    _seed({
+        instinct_dirs.personal / "a.yaml": MULTI_SECTION,
+        # CRLF files must yield their ids too (see test_parse_crlf_line_endings)
+        instinct_dirs.personal / "b.yaml": _MULTI_IDS_C.replace("\n", "\r\n"),
+    })
+    # A non-UTF-8 file is warned about and skipped, not fatal
+    (instinct_dirs.personal / "junk.yaml").write_bytes(b"\xff\xfe\x00garbage")
+
+    assert _mod.load_all_instinct_ids() == {
+        "instinct-a", "instinct-b", "instinct-c",
+    }
+
+
+@pytest.mark.filesystem
+def test_cmd_evolve_finds_skill_clusters(instinct_dirs):
+    docs = []
+    for n in range(3):
+        docs.append(
+            f'---\nid: cluster-{n}\ntrigger: "when writing tests"\n'
+            f"confidence: 0.9\ndomain: testing\n---\n\n## Action\nDo step {n}.\n"
+        )
+    _seed({instinct_dirs.personal / "cluster.yaml": "\n".join(docs)})
+
+    rc, out = _run_capture(_mod.cmd_evolve, _EVOLVE_ARGS)
+    assert rc == 0
+    # Split once and check exact lines instead of rescanning the full
+    # banner per substring assertion
+    lines = set(out.splitlines())
+    assert {"## SKILL CANDIDATES", "   Instincts: 3"} <= lines
+
+
+@pytest.mark.filesystem
+def test_parse_cache_invalidated_on_mtime_change(tmp_path):
+    clear_instinct_cache()
+    file = tmp_path / "a.yaml"
+    file.write_text(MULTI_SECTION)
+
+    first = _load_instincts_from_dir(tmp_path)
+    assert len(first) == 2
+    assert first[0]["_source_file"] == str(file)
+    assert first[0]["_source_type"] == tmp_path.name
+
+    # Rewrite with a bumped mtime; the cache must re-parse the file
+    file.write_text(_MULTI_IDS_Z)
+    os.utime(file, ns=(0, file.stat().st_mtime_ns + 1_000_000_000))
+    ids = [i["id"] for i in _load_instincts_from_dir(tmp_path)]
+    assert "instinct-z" in ids
+
+    clear_instinct_cache()